@@ -0,0 +1,334 @@
+"""Response caching for the Garmin Connect client."""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Seconds a disk-cached response stays fresh when it may still change
+MUTABLE_RESPONSE_TTL = 300
+# Garmin keeps filling in a day's wellness data as devices sync, so only
+# days at least this far back are treated as final
+_SETTLE_DAYS = 2
+# Seconds device lists and settings are reused; they change on the device,
+# not through the client
+DEVICE_TTL = 3600
+# Seconds a single activity and its splits are reused; they can be edited in
+# the Garmin app, which the client never hears about
+ACTIVITY_TTL = 3600
+# Disk TTLs for undated endpoints that change rarely
+_TTL_BY_PREFIX = [
+    ("/device-service/deviceregistration/devices", DEVICE_TTL),
+    ("/device-service/deviceservice/device-info/settings/", DEVICE_TTL),
+    ("/web-gateway/device-info/primary-training-device", DEVICE_TTL),
+    ("/activity-service/activity/activityTypes", 24 * 3600),
+    ("/activity-service/activity/", ACTIVITY_TTL),
+]
+
+
+def request_dates(path: str, params: Dict[str, Any]) -> List[str]:
+    """Return the ISO dates a request is about, found in its path and params."""
+    dates = _DATE_PATTERN.findall(path)
+    for value in params.values():
+        dates += _DATE_PATTERN.findall(str(value))
+    return dates
+
+
+def cache_ttl(path: str, params: Dict[str, Any]) -> Optional[int]:
+    """
+    Responses about settled days never change, so keep them forever; otherwise
+    use the first matching _TTL_BY_PREFIX entry or the default.
+
+    A request is settled when its latest date is more than _SETTLE_DAYS ago
+    and it does not run open-ended from a start date to now.
+    """
+    dates = request_dates(path, params)
+    dated_keys = [
+        key.lower() for key, value in params.items() if _DATE_PATTERN.search(str(value))
+    ]
+    open_ended = any(k.startswith(("start", "from")) for k in dated_keys) and not any(
+        k.startswith(("end", "to", "until")) for k in dated_keys
+    )
+    settled = (date.today() - timedelta(days=_SETTLE_DAYS)).isoformat()
+    if dates and not open_ended and max(dates) < settled:
+        return None
+    if not dates:
+        for prefix, ttl in _TTL_BY_PREFIX:
+            if path.startswith(prefix):
+                return ttl
+    return MUTABLE_RESPONSE_TTL
+
+
+def copy_json(value: Any) -> Any:
+    """Copy decoded JSON; a plain recursive copy is much cheaper than deepcopy."""
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+class LRUCache:
+    """Thread-safe, size-bounded least-recently-used cache with optional expiry.
+
+    A ``maxsize`` of 0 disables caching entirely.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        # key -> (monotonic expiry or None, value)
+        self._data: OrderedDict[Hashable, Tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] <= time.monotonic()):
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the value for key even if it has expired, or None. Expired
+        entries stay until evicted so callers can revalidate them.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key for ttl seconds (None keeps it until evicted or
+        invalidated), evicting the least recently used entry if full.
+        """
+        if self.maxsize <= 0:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose key path starts with prefix."""
+        self.invalidate_where(lambda key: _key_path(key).startswith(prefix))
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": len(self._data),
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _key_path(key: Hashable) -> str:
+    """Keys are either a path string or a tuple whose first element is the path."""
+    return key[0] if isinstance(key, tuple) else str(key)
+
+
+class CachePolicy(Enum):
+    """How the on-disk response cache is used."""
+
+    ENABLED = "enabled"  # serve fresh entries, fetch and store misses
+    READ_ONLY = "read-only"  # serve fresh entries, fetch misses without storing
+    REPLAY = "replay"  # serve any stored entry, fail on misses
+    DISABLED = "disabled"  # always fetch, never store
+
+
+class CachedResponse(NamedTuple):
+    value: Any
+    fresh: bool
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ResponseCache:
+    """SQLite-backed on-disk cache of JSON API responses.
+
+    Entries carry an absolute expiry timestamp, or none for responses that
+    can never change (e.g. data for days that are already over), plus any
+    ETag/Last-Modified validators so expired entries can be revalidated, and
+    the range of dates the request was about so one day can be invalidated.
+    """
+
+    def __init__(self, directory: str):
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "responses.sqlite3"), check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, "
+                "value TEXT NOT NULL, expires REAL, "
+                "etag TEXT, last_modified TEXT, "
+                "first_date TEXT, last_date TEXT)"
+            )
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(responses)")
+            }
+            if "first_date" not in columns:
+                # Older rows cannot be matched by date, so drop them rather
+                # than keep past days that a reload might need to replace
+                self._conn.execute("DELETE FROM responses")
+                self._conn.execute("ALTER TABLE responses ADD COLUMN first_date TEXT")
+                self._conn.execute("ALTER TABLE responses ADD COLUMN last_date TEXT")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded response for key, or None if missing or expired."""
+        entry = self.entry(key)
+        return entry.value if entry is not None and entry.fresh else None
+
+    def entry(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response for key, expired or not, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires, etag, last_modified FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires, etag, last_modified = row
+        fresh = expires is None or expires >= time.time()
+        return CachedResponse(json.loads(value), fresh, etag, last_modified)
+
+    def set(
+        self,
+        key: str,
+        path: str,
+        value: Any,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        dates: Sequence[str] = (),
+    ) -> None:
+        """
+        Store value under key; a ttl of None keeps it until invalidated. dates
+        are the days the request covers, see invalidate_date.
+        """
+        expires = None if ttl is None else time.time() + ttl
+        first_date = min(dates) if dates else None
+        last_date = max(dates) if dates else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, path, value, expires, "
+                "etag, last_modified, first_date, last_date) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    json.dumps(value),
+                    expires,
+                    etag,
+                    last_modified,
+                    first_date,
+                    last_date,
+                ),
+            )
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose request path starts with prefix."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def invalidate_date(self, cdate: str) -> None:
+        """Drop every entry whose request covers the ISO date cdate."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE first_date <= ? AND last_date >= ?",
+                (cdate, cdate),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+
+# Per-user settings that rarely change, so login can skip the settings request
+_SETTINGS_CACHE_PATH = os.path.expanduser("~/.cache/trainme/settings.json")
+_SETTINGS_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def _read_settings_cache() -> Dict[str, Any]:
+    """Return the settings cache, or an empty one if it is missing or corrupt."""
+    try:
+        with open(_SETTINGS_CACHE_PATH, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def cached_unit_system(display_name: Optional[str]) -> Optional[str]:
+    """Return the cached unit system unless it is missing, stale or malformed."""
+    cached = _read_settings_cache().get(str(display_name))
+    if not isinstance(cached, dict):
+        return None
+    ts = cached.get("ts")
+    unit_system = cached.get("unit_system")
+    if not isinstance(ts, (int, float)) or not isinstance(unit_system, str):
+        return None
+    if time.time() - ts > _SETTINGS_MAX_AGE:
+        return None
+    return unit_system
+
+
+def store_unit_system(display_name: Optional[str], unit_system: str) -> None:
+    """Record the user's unit system; failing to write only costs a request."""
+    try:
+        cache = _read_settings_cache()
+        cache[str(display_name)] = {"unit_system": unit_system, "ts": time.time()}
+        os.makedirs(os.path.dirname(_SETTINGS_CACHE_PATH), exist_ok=True)
+        with open(_SETTINGS_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not write settings cache: {e}")
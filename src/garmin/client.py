@@ -1,14 +1,45 @@
 """Python 3 API wrapper for Garmin Connect."""
 
+import hashlib
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timezone, timedelta
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
-
-import garth
-from .fit import FitEncoderWeight
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
+from urllib.parse import urlencode
+
+from .cache import (
+    ACTIVITY_TTL,
+    DEVICE_TTL,
+    MUTABLE_RESPONSE_TTL,
+    CachePolicy,
+    CachedResponse,
+    LRUCache,
+    ResponseCache,
+    cache_ttl,
+    cached_unit_system,
+    copy_json,
+    request_dates,
+    store_unit_system,
+)
+from .rate_limit import TokenBucket
 
 from .models.workout import (
     WorkoutDetail,
@@ -34,14 +65,134 @@ from .models.user_fitness_data import (
 )
 from .user_fitness_data_parser import UserFitnessDataParser
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Seconds an in-memory response is reused by default
+_MEMO_TTL = 60
+# Response shapes connectapi(expect=...) can check for and narrow to
+_Shape = TypeVar("_Shape", Dict[str, Any], List[Any])
+
+
+def _params(**kwargs: Any) -> Dict[str, str]:
+    """Build query params, stringifying values and dropping the ones that are None."""
+    return {key: str(value) for key, value in kwargs.items() if value is not None}
+
+
+def _fmt_ts(dt: datetime) -> str:
+    """Format a timestamp the way Garmin's write endpoints expect, dropping any offset."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.00")
+
+
+def _normalize_ts(timestamp: Optional[str]) -> Tuple[datetime, datetime]:
+    """Parse an ISO timestamp (default now) into (local, UTC) datetimes."""
+    dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+    # Apply timezone offset to get UTC/GMT time
+    return dt, dt if dt.tzinfo is timezone.utc else dt.astimezone(timezone.utc)
+
+
+def _write_private(path: str, text: str) -> None:
+    """
+    Replace path with text, readable by the owner only. The text goes to a
+    temporary file first so a crash cannot leave path truncated.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # mkstemp creates the file with mode 0600
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# get_range metrics served by a single request: metric -> (method, date field)
+_RANGE_METRICS = {
+    "steps": ("get_daily_steps", "calendarDate"),
+}
+# get_range metrics fetched with one request per day: metric -> method(cdate)
+_DAILY_METRICS = {
+    "steps_chart": "get_steps_data",
+    "floors": "get_floors",
+    "heart_rates": "get_heart_rates",
+    "user_summary": "get_user_summary",
+    "sleep": "get_sleep_data",
+    "stress": "get_stress_data",
+    "rhr": "get_rhr_day",
+    "hrv": "get_hrv_data",
+    "heart_rate": "get_heart_rate_data",
+    "all_day_stress": "get_all_day_stress",
+    "body_battery_events": "get_body_battery_events",
+    "hydration": "get_hydration_data",
+    "respiration": "get_respiration_data",
+    "spo2": "get_spo2_data",
+    "intensity_minutes": "get_intensity_minutes_data",
+    "max_metrics": "get_max_metrics",
+    "training_readiness": "get_training_readiness",
+    "training_status": "get_training_status",
+    "fitness_age": "get_fitnessage_data",
+    "hill_score": "get_hill_score",
+}
+
 
 class Garmin:
     """Class for fetching data from Garmin Connect."""
 
-    _instance = None
-    _initialized = False
+    __slots__ = (
+        "username",
+        "password",
+        "is_cn",
+        "prompt_mfa",
+        "return_on_mfa",
+        "tokens",
+        "garth",
+        "display_name",
+        "full_name",
+        "unit_system",
+        "prefetch",
+        "max_retries",
+        "retry_base_delay",
+        "retry_budget",
+        "_rate_limiter",
+        "_response_cache",
+        "_disk_cache",
+        "cache_policy",
+        "_prefetch_pool",
+        "_inflight",
+        "_inflight_lock",
+        "_url_user_summary",
+        "_url_steps_chart",
+        "_url_heart_rate_daily",
+        "_url_personal_record",
+        "_url_sleep_daily",
+        "_url_rhr",
+        "_url_race_predictions_latest",
+    )
+
+    # URLs used multiple times across methods
+    garmin_connect_user_settings_url = "/userprofile-service/userprofile/user-settings"
+    garmin_connect_weight_url = "/weight-service"
+    garmin_connect_set_blood_pressure_endpoint = "/bloodpressure-service/bloodpressure"
+    garmin_connect_endurance_score_url = "/metrics-service/metrics/endurancescore"
+    garmin_connect_race_predictor_url = "/metrics-service/metrics/racepredictions"
+    garmin_connect_user_summary_chart = "/wellness-service/wellness/dailySummaryChart"
+    garmin_connect_daily_intensity_minutes = "/wellness-service/wellness/daily/im"
+    garmin_connect_activities = "/activitylist-service/activities/search/activities"
+    garmin_connect_activities_baseurl = "/activitylist-service/activities/"
+    garmin_connect_activity = "/activity-service/activity"
+    garmin_connect_gear = "/gear-service/gear/filterGear"
+    garmin_connect_gear_baseurl = "/gear-service/gear/"
+    garmin_workouts = "/workout-service"
+
+    # Clients keyed by (email, is_cn); _latest backs the argument-free get_instance()
+    _registry: Dict[Tuple[str, bool], "Garmin"] = {}
+    _registry_lock = threading.RLock()
+    _latest: Optional["Garmin"] = None
 
     def __init__(
         self,
@@ -51,10 +202,28 @@ class Garmin:
         prompt_mfa=None,
         return_on_mfa=False,
         tokens: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_policy: CachePolicy | str = CachePolicy.ENABLED,
+        prefetch: bool = False,
+        max_retries: int = 4,
+        retry_base_delay: float = 0.5,
+        retry_budget: float = 10.0,
+        requests_per_minute: Optional[float] = 120,
     ):
-        """Create a new class instance."""
-        if self._initialized:
-            return
+        """Create a new class instance.
+
+        Pass cache_dir (e.g. "~/.cache/trainme/garmin") to persist GET
+        responses on disk between runs; cache_policy ("enabled", "read-only",
+        "replay" or "disabled") controls how that cache is used. With
+        prefetch=True, today's summary, sleep, body battery and HRV are fetched
+        in the background after login, and get_last_activity does the same for
+        the activity's details, splits and weather. Reads are throttled to
+        requests_per_minute (None disables it), and those that still hit a 429
+        or 5xx are retried up to max_retries times with exponential backoff
+        starting at retry_base_delay seconds, giving up as soon as the next
+        wait would end more than retry_budget seconds after the first attempt
+        (the default keeps calls under the MCP server's 15s timeout).
+        """
         self.username = email
         self.password = password
         # use .cn urls (China)
@@ -63,54 +232,69 @@ class Garmin:
         self.return_on_mfa = return_on_mfa
         self.tokens: Optional[str] = tokens
 
-        # URLs used multiple times across methods
-        self.garmin_connect_user_settings_url = (
-            "/userprofile-service/userprofile/user-settings"
-        )
-        self.garmin_connect_weight_url = "/weight-service"
-        self.garmin_connect_set_blood_pressure_endpoint = (
-            "/bloodpressure-service/bloodpressure"
-        )
-        self.garmin_connect_endurance_score_url = (
-            "/metrics-service/metrics/endurancescore"
-        )
-        self.garmin_connect_race_predictor_url = (
-            "/metrics-service/metrics/racepredictions"
-        )
-        self.garmin_connect_user_summary_chart = (
-            "/wellness-service/wellness/dailySummaryChart"
-        )
-        self.garmin_connect_daily_intensity_minutes = (
-            "/wellness-service/wellness/daily/im"
-        )
-        self.garmin_connect_activities = (
-            "/activitylist-service/activities/search/activities"
-        )
-        self.garmin_connect_activities_baseurl = "/activitylist-service/activities/"
-        self.garmin_connect_activity = "/activity-service/activity"
-        self.garmin_connect_gear = "/gear-service/gear/filterGear"
-        self.garmin_connect_gear_baseurl = "/gear-service/gear/"
-        self.garmin_workouts = "/workout-service"
+        # Imported here so importing this module for its models and helpers
+        # does not pay for garth's SSO/crypto stack
+        import garth
 
         self.garth = garth.Client(
             domain="garmin.cn" if self.is_cn else "garmin.com",
             pool_connections=20,
             pool_maxsize=20,
         )
-        self.display_name = None
-        self.full_name = None
-        self.unit_system = None
-        self._initialized = True
-        Garmin._instance = self
+        self.display_name: Optional[str] = None
+        self._set_user_urls()
+        self.full_name: Optional[str] = None
+        self.unit_system: Optional[str] = None
+        # In-process memo for reads; GARMIN_CACHE_SIZE=0 disables it
+        self._response_cache = LRUCache(int(os.getenv("GARMIN_CACHE_SIZE", "256")))
+        self._disk_cache = ResponseCache(cache_dir) if cache_dir else None
+        self.cache_policy = CachePolicy(cache_policy)
+        if self.cache_policy is CachePolicy.REPLAY and self._disk_cache is None:
+            raise ValueError("Replay cache policy requires a cache_dir")
+        self.prefetch = prefetch
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_budget = retry_budget
+        self._rate_limiter = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        # Cached reads already on the wire, joined by identical concurrent calls
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        with Garmin._registry_lock:
+            Garmin._registry[(email, is_cn)] = self
+            Garmin._latest = self
 
     @classmethod
-    def get_instance(cls) -> "Garmin":
-        """Get singleton instance of Garmin client."""
-        if cls._instance is None:
-            raise GarminConnectConnectionError(
-                "Failed to retrieve Garmin singleton. Ensure the object is initialized before calling get_instance()"
-            )
-        return cls._instance
+    def get_instance(
+        cls,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        is_cn: bool = False,
+        **kwargs: Any,
+    ) -> "Garmin":
+        """
+        Return the client registered for (email, is_cn), creating it if needed.
+
+        Without an email, return the most recently created client.
+        """
+        with cls._registry_lock:
+            if email is None:
+                if cls._latest is None:
+                    raise GarminConnectConnectionError(
+                        "Failed to retrieve Garmin client. Ensure one is created before calling get_instance()"
+                    )
+                return cls._latest
+
+            instance = cls._registry.get((email, is_cn))
+            if instance is None:
+                if password is None:
+                    raise GarminConnectAuthenticationError(
+                        f"No Garmin client registered for {email} and no password given"
+                    )
+                instance = cls(email, password, is_cn=is_cn, **kwargs)
+            return instance
 
     def __enter__(self):
         """Initialize garth client when entering context."""
@@ -119,28 +303,281 @@ class Garmin:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up when exiting context."""
-        print("Exited Garmin client (no-op)")
+        self.close()
+        logger.debug("Exited Garmin client")
         return False
 
-    def connectapi(self, path: str, **kwargs) -> Dict[str, Any] | List[Any]:
+    def close(self) -> None:
+        """Stop background prefetching; prefetches not yet started are dropped."""
+        pool, self._prefetch_pool = self._prefetch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @overload
+    def connectapi(
+        self,
+        path: str,
+        use_cache: bool = ...,
+        memo_ttl: Optional[float] = ...,
+        *,
+        expect: Type[_Shape],
+        **kwargs: Any,
+    ) -> _Shape: ...
+
+    @overload
+    def connectapi(
+        self,
+        path: str,
+        use_cache: bool = ...,
+        memo_ttl: Optional[float] = ...,
+        expect: None = ...,
+        **kwargs: Any,
+    ) -> Dict[str, Any] | List[Any]: ...
+
+    def connectapi(
+        self,
+        path: str,
+        use_cache: bool = True,
+        memo_ttl: Optional[float] = _MEMO_TTL,
+        expect: Optional[type] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any] | List[Any]:
         """
         Note that self.garth.connectapi can return either a List[Any] | Dict[str, Any]
+
+        Responses are kept in memory for memo_ttl seconds per (path, params);
+        memo_ttl=None keeps them until a write to the same service invalidates
+        them and memo_ttl=0 skips the memo. When a cache_dir was configured,
+        responses are also stored on disk. use_cache=False skips both tiers.
+        Concurrent identical cached reads share a single request. Every call
+        gets its own copy of the response, so callers may modify it freely.
+        Pass expect=dict or expect=list to reject any other shape.
         """
-        result = self.garth.connectapi(path, **kwargs)
+        if use_cache:
+            # The cached object is shared with the cache and other callers
+            result: Dict[str, Any] | List[Any] = copy_json(
+                self._coalesced(path, memo_ttl, **kwargs)
+            )
+        else:
+            result = self._connectapi(path, use_cache, memo_ttl, **kwargs)
+        if expect is not None and not isinstance(result, expect):
+            raise GarminConnectConnectionError(
+                f"Expected {expect.__name__} response from {path}, got {type(result)}"
+            )
+        return result
+
+    def _coalesced(self, path: str, memo_ttl: Optional[float], **kwargs: Any) -> Any:
+        """Run a cached read, or wait for the identical one already in flight."""
+        params = kwargs.get("params") or {}
+        key = (path, tuple(sorted(params.items())))
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future: Future = Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            logger.debug(f"Joining in-flight request for {path}")
+            return inflight.result()
+
+        try:
+            result = self._connectapi(path, True, memo_ttl, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _connectapi(
+        self, path: str, use_cache: bool, memo_ttl: Optional[float], **kwargs: Any
+    ) -> Any:
+        """Return the decoded response, shared with the caches; see connectapi."""
+        params = kwargs.get("params") or {}
+
+        # Both tiers hold CachedResponse entries so that expired ones can be
+        # revalidated with a conditional GET instead of refetched in full
+        memo_key = None
+        disk_key = None
+        stale = None
+        if use_cache and memo_ttl != 0:
+            memo_key = (path, tuple(sorted(params.items())))
+            cached = self._response_cache.get(memo_key)
+            if cached is not None:
+                logger.debug(f"Cache hit for {path}")
+                return cached.value
+            stale = self._response_cache.get_stale(memo_key)
+
+        policy = self.cache_policy
+        if (
+            use_cache
+            and self._disk_cache is not None
+            and policy is not CachePolicy.DISABLED
+        ):
+            disk_key = self._disk_cache_key(path, params)
+            entry = self._disk_cache.entry(disk_key)
+            if entry is not None and (entry.fresh or policy is CachePolicy.REPLAY):
+                logger.debug(f"Disk cache hit for {path}")
+                if memo_key is not None:
+                    self._response_cache.set(memo_key, entry, memo_ttl)
+                return entry.value
+            if policy is CachePolicy.REPLAY:
+                raise GarminConnectConnectionError(
+                    f"No cached response for {path} in replay mode"
+                )
+            if entry is not None and (entry.etag or entry.last_modified):
+                stale = entry
+
+        headers = {}
+        if stale is not None and stale.etag:
+            headers["If-None-Match"] = stale.etag
+        if stale is not None and stale.last_modified:
+            headers["If-Modified-Since"] = stale.last_modified
+
+        response = self._fetch_with_retry(path, headers=headers, **kwargs)
+        if response.status_code == 304 and stale is not None:
+            logger.debug(f"Cached response for {path} not modified")
+            result = stale.value
+        elif response.status_code == 204:
+            result = None
+        else:
+            result = response.json()
         if result is None:
             raise GarminConnectConnectionError(
                 f"No data returned from API endpoint: {path}"
             )
+        etag = response.headers.get("ETag") or (stale and stale.etag)
+        last_modified = response.headers.get("Last-Modified") or (
+            stale and stale.last_modified
+        )
+        if memo_key is not None:
+            self._response_cache.set(
+                memo_key,
+                CachedResponse(result, True, etag, last_modified),
+                memo_ttl,
+            )
+        if (
+            self._disk_cache is not None
+            and disk_key is not None
+            and policy is CachePolicy.ENABLED
+        ):
+            self._disk_cache.set(
+                disk_key,
+                path,
+                result,
+                cache_ttl(path, params),
+                etag=etag,
+                last_modified=last_modified,
+                dates=request_dates(path, params),
+            )
         return result
 
+    def _fetch_with_retry(
+        self, path: str, headers: Dict[str, str], **kwargs: Any
+    ) -> "requests.Response":
+        """GET from connectapi, backing off on rate limits and transient server errors."""
+        from garth.exc import GarthHTTPError
+
+        deadline = time.monotonic() + self.retry_budget
+        for attempt in range(self.max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                # Always pass a fresh headers dict; garth's default is shared
+                return self.garth.request(
+                    "GET", "connectapi", path, api=True, headers=dict(headers), **kwargs
+                )
+            except GarthHTTPError as e:
+                response = e.error.response
+                if response is None:
+                    raise
+                status = response.status_code
+                if status == 429:
+                    try:
+                        delay = float(response.headers.get("Retry-After", ""))
+                    except ValueError:
+                        delay = self.retry_base_delay * 2**attempt
+                elif 500 <= status < 600:
+                    delay = self.retry_base_delay * 2**attempt + random.random()
+                else:
+                    raise
+                out_of_time = time.monotonic() + delay > deadline
+                if attempt == self.max_retries or out_of_time:
+                    if status == 429:
+                        raise GarminConnectTooManyRequestsError(
+                            f"Rate limited by Garmin on {path}"
+                        ) from e
+                    raise
+                logger.debug(f"Got HTTP {status} from {path}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+    def _disk_cache_key(self, path: str, params: Dict[str, Any]) -> str:
+        """Key responses by path, sorted params and the logged-in user."""
+        raw = f"{path}?{urlencode(sorted(params.items()))}#{self.display_name}"
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response, in memory and on disk."""
+        self._response_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the in-memory response cache."""
+        return self._response_cache.stats()
+
+    def _invalidate_cache(self, prefix: str) -> None:
+        """Drop cached responses under prefix after a write to that service."""
+        self._response_cache.invalidate(prefix)
+        if self._disk_cache is not None:
+            self._disk_cache.invalidate(prefix)
+
+    def _invalidate_date(self, cdate: str) -> None:
+        """Drop cached responses for requests whose dates cover cdate."""
+
+        def covers(key: Any) -> bool:
+            path, params = key
+            dates = request_dates(path, dict(params))
+            return bool(dates) and min(dates) <= cdate <= max(dates)
+
+        self._response_cache.invalidate_where(covers)
+        if self._disk_cache is not None:
+            self._disk_cache.invalidate_date(cdate)
+
     def download(self, path, **kwargs):
         return self.garth.download(path, **kwargs)
 
     def login(self, /, tokenstore: Optional[str] = None) -> str:
-        """Log in using Garth."""
+        """
+        Log in using Garth.
+
+        Saved tokens (the tokens argument, else the tokenstore file) are tried
+        first; the full SSO login only runs when there are none or Garmin
+        rejects them. When a tokenstore path is given the current tokens are
+        written back to it.
+        """
+        if tokenstore:
+            tokenstore = os.path.expanduser(tokenstore)
+            if not self.tokens and os.path.exists(tokenstore):
+                with open(tokenstore, "r") as f:
+                    self.tokens = f.read().strip() or None
+
+        from garth.exc import GarthHTTPError
+
+        resumed = False
         if self.tokens:
-            self.garth.loads(self.tokens)
-        else:
+            try:
+                self.garth.loads(self.tokens)
+                # Fetching the profile proves the saved tokens are still accepted
+                self.garth.profile
+                resumed = True
+            except (GarthHTTPError, ValueError, TypeError) as e:
+                logger.info(f"Saved tokens rejected, logging in again: {e}")
+
+        if not resumed:
             if self.return_on_mfa:
                 self.garth.login(
                     self.username, self.password, return_on_mfa=self.return_on_mfa
@@ -151,6 +588,9 @@ class Garmin:
                 )
 
         self.tokens = self.garth.dumps()
+        if tokenstore:
+            # The tokens grant full account access, so keep them private
+            _write_private(tokenstore, self.tokens)
 
         self.display_name = self.garth.profile["displayName"]
         self.full_name = self.garth.profile["fullName"]
@@ -158,13 +598,13 @@ class Garmin:
             raise GarminConnectConnectionError(
                 f"Failed to retrieve displayName or fullName. Got displayName {self.display_name} and fullName {self.full_name}"
             )
+        self._set_user_urls()
 
-        settings = self.garth.connectapi(self.garmin_connect_user_settings_url)
-        if not settings or not isinstance(settings, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from user settings API, got {type(settings)}"
-            )
-        self.unit_system = settings["userData"]["measurementSystem"]
+        self.unit_system = (
+            cached_unit_system(self.display_name) or self.refresh_settings()
+        )
+        if self.prefetch:
+            self._start_prefetch()
 
         return self.tokens
 
@@ -174,15 +614,74 @@ class Garmin:
 
         self.display_name = self.garth.profile["displayName"]
         self.full_name = self.garth.profile["fullName"]
+        self._set_user_urls()
 
+        self.unit_system = (
+            cached_unit_system(self.display_name) or self.refresh_settings()
+        )
+        if self.prefetch:
+            self._start_prefetch()
+
+        return result1, result2
+
+    def _set_user_urls(self) -> None:
+        """Build the URLs scoped to display_name once, rather than per request."""
+        self._url_user_summary = (
+            f"/usersummary-service/usersummary/daily/{self.display_name}"
+        )
+        self._url_steps_chart = (
+            f"{self.garmin_connect_user_summary_chart}/{self.display_name}"
+        )
+        self._url_heart_rate_daily = (
+            f"/wellness-service/wellness/dailyHeartRate/{self.display_name}"
+        )
+        self._url_personal_record = (
+            f"/personalrecord-service/personalrecord/prs/{self.display_name}"
+        )
+        self._url_sleep_daily = (
+            f"/wellness-service/wellness/dailySleepData/{self.display_name}"
+        )
+        self._url_rhr = f"/userstats-service/wellness/daily/{self.display_name}"
+        self._url_race_predictions_latest = (
+            f"{self.garmin_connect_race_predictor_url}/latest/{self.display_name}"
+        )
+
+    def refresh_settings(self) -> str:
+        """Fetch the user's unit system from Garmin and update the local cache."""
         settings = self.garth.connectapi(self.garmin_connect_user_settings_url)
         if not settings or not isinstance(settings, dict):
             raise GarminConnectConnectionError(
                 f"Expected dict response from user settings API, got {type(settings)}"
             )
-        self.unit_system = settings["userData"]["measurementSystem"]
+        unit_system: str = settings["userData"]["measurementSystem"]
+        self.unit_system = unit_system
+        store_unit_system(self.display_name, unit_system)
+        return unit_system
+
+    def _start_prefetch(self) -> None:
+        """Warm the endpoints callers almost always hit right after login."""
+        today = date.today().isoformat()
+        for fetch in (
+            self.get_user_summary,
+            self.get_sleep_data,
+            self.get_body_battery,
+            self.get_hrv_data,
+        ):
+            self._prefetch(fetch, today)
+
+    def _prefetch(self, fetch: Callable[[Any], Any], arg: Any) -> None:
+        """Run fetch(arg) in the background so its response is in the cache."""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="garmin-prefetch"
+            )
+        self._prefetch_pool.submit(self._prefetch_one, fetch, arg)
 
-        return result1, result2
+    def _prefetch_one(self, fetch: Callable[[Any], Any], arg: Any) -> None:
+        try:
+            fetch(arg)
+        except Exception as e:
+            logger.debug(f"Prefetch of {fetch.__name__} failed: {e}")
 
     def get_full_name(self):
         """Return full name."""
@@ -197,16 +696,11 @@ class Garmin:
     def get_user_summary(self, cdate: str) -> Dict[str, Any]:
         """Return user activity summary for 'cdate' format 'YYYY-MM-DD'."""
 
-        url = f"/usersummary-service/usersummary/daily/{self.display_name}"
+        url = self._url_user_summary
         params = {"calendarDate": str(cdate)}
         logger.debug("Requesting user summary")
 
-        response = self.connectapi(url, params=params)
-
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
+        response = self.connectapi(url, params=params, expect=dict)
 
         if response["privacyProtected"] is True:
             raise GarminConnectAuthenticationError("Authentication error")
@@ -216,7 +710,7 @@ class Garmin:
     def get_steps_data(self, cdate):
         """Fetch available steps data 'cDate' format 'YYYY-MM-DD'."""
 
-        url = f"{self.garmin_connect_user_summary_chart}/{self.display_name}"
+        url = self._url_steps_chart
         params = {"date": str(cdate)}
         logger.debug("Requesting steps data")
 
@@ -241,7 +735,7 @@ class Garmin:
     def get_heart_rates(self, cdate):
         """Fetch available heart rates data 'cDate' format 'YYYY-MM-DD'."""
 
-        url = f"/wellness-service/wellness/dailyHeartRate/{self.display_name}"
+        url = self._url_heart_rate_daily
         params = {"date": str(cdate)}
         logger.debug("Requesting heart rates")
 
@@ -250,10 +744,13 @@ class Garmin:
     def get_user_summary_and_body(self, cdate):
         """Return activity data and body composition (compat for garminconnect)."""
 
-        return {
-            **self.get_user_summary(cdate),
-            **self.get_body_composition(cdate)["totalAverage"],
-        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            summary = executor.submit(self.get_user_summary, cdate)
+            body_composition = executor.submit(self.get_body_composition, cdate)
+            return {
+                **summary.result(),
+                **body_composition.result()["totalAverage"],
+            }
 
     def get_body_composition(self, startdate: str, enddate=None) -> Dict[str, Any]:
         """
@@ -267,12 +764,7 @@ class Garmin:
         params = {"startDate": str(startdate), "endDate": str(enddate)}
         logger.debug("Requesting body composition")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def add_body_composition(
         self,
@@ -290,6 +782,8 @@ class Garmin:
         visceral_fat_rating: Optional[float] = None,
         bmi: Optional[float] = None,
     ):
+        from .fit import FitEncoderWeight
+
         dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
         fitEncoder = FitEncoderWeight()
         fitEncoder.write_file_info()
@@ -314,27 +808,33 @@ class Garmin:
 
         url = "/upload-service/upload"
         files = {
-            "file": ("body_composition.fit", fitEncoder.getvalue()),
+            "file": (
+                "body_composition.fit",
+                fitEncoder.stream(),
+                "application/octet-stream",
+            ),
         }
-        return self.garth.post("connectapi", url, files=files, api=True)
+        response = self.garth.post("connectapi", url, files=files, api=True)
+        self._invalidate_cache(self.garmin_connect_weight_url)
+        return response
 
     def add_weigh_in(self, weight: int, unitKey: str = "kg", timestamp: str = ""):
         """Add a weigh-in (default to kg)"""
 
         url = f"{self.garmin_connect_weight_url}/user-weight"
-        dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
-        # Apply timezone offset to get UTC/GMT time
-        dtGMT = dt.astimezone(timezone.utc)
+        dt, dtGMT = _normalize_ts(timestamp)
         payload = {
-            "dateTimestamp": dt.isoformat()[:19] + ".00",
-            "gmtTimestamp": dtGMT.isoformat()[:19] + ".00",
+            "dateTimestamp": _fmt_ts(dt),
+            "gmtTimestamp": _fmt_ts(dtGMT),
             "unitKey": unitKey,
             "sourceType": "MANUAL",
             "value": weight,
         }
         logger.debug("Adding weigh-in")
 
-        return self.garth.post("connectapi", url, json=payload)
+        response = self.garth.post("connectapi", url, json=payload)
+        self._invalidate_cache(self.garmin_connect_weight_url)
+        return response
 
     def add_weigh_in_with_timestamps(
         self,
@@ -348,17 +848,14 @@ class Garmin:
         url = f"{self.garmin_connect_weight_url}/user-weight"
 
         # Validate and format the timestamps
-        dt = datetime.fromisoformat(dateTimestamp) if dateTimestamp else datetime.now()
-        dtGMT = (
-            datetime.fromisoformat(gmtTimestamp)
-            if gmtTimestamp
-            else dt.astimezone(timezone.utc)
-        )
+        dt, dtGMT = _normalize_ts(dateTimestamp)
+        if gmtTimestamp:
+            dtGMT = datetime.fromisoformat(gmtTimestamp)
 
         # Build the payload
         payload = {
-            "dateTimestamp": dt.isoformat()[:19] + ".00",  # Local time
-            "gmtTimestamp": dtGMT.isoformat()[:19] + ".00",  # GMT/UTC time
+            "dateTimestamp": _fmt_ts(dt),  # Local time
+            "gmtTimestamp": _fmt_ts(dtGMT),  # GMT/UTC time
             "unitKey": unitKey,
             "sourceType": "MANUAL",
             "value": weight,
@@ -368,7 +865,9 @@ class Garmin:
         logger.debug(f"Adding weigh-in with explicit timestamps: {payload}")
 
         # Make the POST request
-        return self.garth.post("connectapi", url, json=payload)
+        response = self.garth.post("connectapi", url, json=payload)
+        self._invalidate_cache(self.garmin_connect_weight_url)
+        return response
 
     def get_weigh_ins(self, startdate: str, enddate: str):
         """Get weigh-ins between startdate and enddate using format 'YYYY-MM-DD'."""
@@ -386,24 +885,21 @@ class Garmin:
         params = {"includeAll": True}
         logger.debug("Requesting weigh-ins")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def delete_weigh_in(self, weight_pk: str, cdate: str):
         """Delete specific weigh-in."""
         url = f"{self.garmin_connect_weight_url}/weight/{cdate}/byversion/{weight_pk}"
         logger.debug("Deleting weigh-in")
 
-        return self.garth.request(
+        response = self.garth.request(
             "DELETE",
             "connectapi",
             url,
             api=True,
         )
+        self._invalidate_cache(self.garmin_connect_weight_url)
+        return response
 
     def delete_weigh_ins(self, cdate: str, delete_all: bool = False):
         """
@@ -424,8 +920,18 @@ class Garmin:
                 )
                 return
 
-        for w in weigh_ins:
-            self.delete_weigh_in(w["samplePk"], cdate)
+        with ThreadPoolExecutor(max_workers=min(8, len(weigh_ins))) as executor:
+            futures = [
+                executor.submit(self.delete_weigh_in, w["samplePk"], cdate)
+                for w in weigh_ins
+            ]
+
+        # Let every delete finish before surfacing the first failure
+        errors = [e for f in futures if (e := f.exception()) is not None]
+        for e in errors:
+            logger.warning(f"Failed to delete weigh-in on {cdate}: {e}")
+        if errors:
+            raise errors[0]
 
         return len(weigh_ins)
 
@@ -472,12 +978,10 @@ class Garmin:
         """
 
         url = f"{self.garmin_connect_set_blood_pressure_endpoint}"
-        dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
-        # Apply timezone offset to get UTC/GMT time
-        dtGMT = dt.astimezone(timezone.utc)
+        dt, dtGMT = _normalize_ts(timestamp)
         payload = {
-            "measurementTimestampLocal": dt.isoformat()[:19] + ".00",
-            "measurementTimestampGMT": dtGMT.isoformat()[:19] + ".00",
+            "measurementTimestampLocal": _fmt_ts(dt),
+            "measurementTimestampGMT": _fmt_ts(dtGMT),
             "systolic": systolic,
             "diastolic": diastolic,
             "pulse": pulse,
@@ -487,7 +991,9 @@ class Garmin:
 
         logger.debug("Adding blood pressure")
 
-        return self.garth.post("connectapi", url, json=payload)
+        response = self.garth.post("connectapi", url, json=payload)
+        self._invalidate_cache(self.garmin_connect_set_blood_pressure_endpoint)
+        return response
 
     def get_blood_pressure(self, startdate: str, enddate=None) -> Dict[str, Any]:
         """
@@ -501,24 +1007,21 @@ class Garmin:
         params = {"includeAll": True}
         logger.debug("Requesting blood pressure data")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def delete_blood_pressure(self, version: str, cdate: str):
         """Delete specific blood pressure measurement."""
         url = f"{self.garmin_connect_set_blood_pressure_endpoint}/{cdate}/{version}"
         logger.debug("Deleting blood pressure measurement")
 
-        return self.garth.request(
+        response = self.garth.request(
             "DELETE",
             "connectapi",
             url,
             api=True,
         )
+        self._invalidate_cache(self.garmin_connect_set_blood_pressure_endpoint)
+        return response
 
     def get_max_metrics(self, cdate: str) -> MaxMetricsData:
         """Return available max metric data for 'cdate' format 'YYYY-MM-DD'."""
@@ -526,12 +1029,8 @@ class Garmin:
         url = f"/metrics-service/metrics/maxmet/latest/{cdate}"
         logger.debug("Requesting max metrics")
 
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=dict)
         logger.debug(f"Max metrics response: {response}")
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
         return UserFitnessDataParser.parse_max_metrics_data(response)
 
     def add_hydration_data(
@@ -555,12 +1054,12 @@ class Garmin:
 
         elif cdate is not None and timestamp is None:
             # If cdate is not null, use timestamp associated with midnight
-            raw_ts = datetime.strptime(cdate, "%Y-%m-%d")
+            raw_ts = datetime.fromisoformat(cdate)
             timestamp = datetime.strftime(raw_ts, "%Y-%m-%dT%H:%M:%S.%f")
 
         elif cdate is None and timestamp is not None:
             # If timestamp is not null, set cdate equal to date part of timestamp
-            raw_ts = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f")
+            raw_ts = datetime.fromisoformat(timestamp)
             cdate = str(raw_ts.date())
 
         payload = {
@@ -571,7 +1070,9 @@ class Garmin:
 
         logger.debug("Adding hydration data")
 
-        return self.garth.put("connectapi", url, json=payload, api=True).json()
+        response = self.garth.put("connectapi", url, json=payload, api=True)
+        self._invalidate_cache("/usersummary-service/usersummary/hydration")
+        return response.json()
 
     def get_hydration_data(self, cdate: str) -> Dict[str, Any]:
         """Return available hydration data 'cdate' format 'YYYY-MM-DD'."""
@@ -579,12 +1080,7 @@ class Garmin:
         url = f"/usersummary-service/usersummary/hydration/daily/{cdate}"
         logger.debug("Requesting hydration data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_respiration_data(self, cdate: str) -> Dict[str, Any]:
         """Return available respiration data 'cdate' format 'YYYY-MM-DD'."""
@@ -592,12 +1088,7 @@ class Garmin:
         url = f"/wellness-service/wellness/daily/respiration/{cdate}"
         logger.debug("Requesting respiration data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_spo2_data(self, cdate: str) -> Dict[str, Any]:
         """Return available SpO2 data 'cdate' format 'YYYY-MM-DD'."""
@@ -605,12 +1096,7 @@ class Garmin:
         url = f"/wellness-service/wellness/daily/spo2/{cdate}"
         logger.debug("Requesting SpO2 data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_intensity_minutes_data(self, cdate: str) -> Dict[str, Any]:
         """Return available Intensity Minutes data 'cdate' format 'YYYY-MM-DD'."""
@@ -618,12 +1104,7 @@ class Garmin:
         url = f"{self.garmin_connect_daily_intensity_minutes}/{cdate}"
         logger.debug("Requesting Intensity Minutes data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_all_day_stress(self, cdate: str) -> StressData:
         """Return available all day stress data 'cdate' format 'YYYY-MM-DD'."""
@@ -631,12 +1112,8 @@ class Garmin:
         url = f"/wellness-service/wellness/dailyStress/{cdate}"
         logger.debug("Requesting all day stress data")
 
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=dict)
         logger.debug(f"All day stress response: {response}")
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
         return UserFitnessDataParser.parse_stress_data(response)
 
     def get_all_day_events(self, cdate: str) -> Dict[str, Any]:
@@ -648,25 +1125,15 @@ class Garmin:
         url = f"/wellness-service/wellness/dailyEvents?calendarDate={cdate}"
         logger.debug("Requesting all day events data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_personal_record(self) -> Dict[str, Any]:
         """Return personal records for current user."""
 
-        url = f"/personalrecord-service/personalrecord/prs/{self.display_name}"
+        url = self._url_personal_record
         logger.debug("Requesting personal records for user")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_earned_badges(self) -> Dict[str, Any]:
         """Return earned badges for current user."""
@@ -674,12 +1141,7 @@ class Garmin:
         url = "/badge-service/badge/earned"
         logger.debug("Requesting earned badges for user")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_adhoc_challenges(self, start, limit) -> Dict[str, Any]:
         """Return adhoc challenges for current user."""
@@ -688,12 +1150,7 @@ class Garmin:
         params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting adhoc challenges for user")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return badge challenges for current user."""
@@ -702,12 +1159,7 @@ class Garmin:
         params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting badge challenges for user")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_available_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return available badge challenges."""
@@ -716,12 +1168,7 @@ class Garmin:
         params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting available badge challenges")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_non_completed_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return badge non-completed challenges for current user."""
@@ -730,12 +1177,7 @@ class Garmin:
         params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting badge challenges for user")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_inprogress_virtual_challenges(self, start, limit) -> Dict[str, Any]:
         """Return in-progress virtual challenges for current user."""
@@ -744,26 +1186,17 @@ class Garmin:
         params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting in-progress virtual challenges for user")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_sleep_data(self, cdate: str) -> SleepData:
         """Return sleep data for current user."""
 
-        url = f"/wellness-service/wellness/dailySleepData/{self.display_name}"
+        url = self._url_sleep_daily
         params = {"date": str(cdate), "nonSleepBufferMinutes": 60}
         logger.debug("Requesting sleep data")
 
-        response = self.connectapi(url, params=params)
+        response = self.connectapi(url, params=params, expect=dict)
         logger.debug(f"Sleep data response: {response}")
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
         return UserFitnessDataParser.parse_sleep_data(response)
 
     def get_stress_data(self, cdate: str) -> Dict[str, Any]:
@@ -772,17 +1205,12 @@ class Garmin:
         url = f"/wellness-service/wellness/dailyStress/{cdate}"
         logger.debug("Requesting stress data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_rhr_day(self, cdate: str) -> Dict[str, Any]:
         """Return resting heartrate data for current user."""
 
-        url = f"/userstats-service/wellness/daily/{self.display_name}"
+        url = self._url_rhr
         params = {
             "fromDate": str(cdate),
             "untilDate": str(cdate),
@@ -790,12 +1218,7 @@ class Garmin:
         }
         logger.debug("Requesting resting heartrate data")
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, params=params, expect=dict)
 
     def get_hrv_data(self, cdate: str) -> Dict[str, Any]:
         """Return Heart Rate Variability (hrv) data for current user."""
@@ -803,17 +1226,15 @@ class Garmin:
         url = f"/hrv-service/hrv/{cdate}"
         logger.debug("Requesting Heart Rate Variability (hrv) data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_heart_rate_data(self, cdate: str) -> HeartRateData:
         """Return combined heart rate and HRV data."""
-        rhr_data = self.get_rhr_day(cdate)
-        hrv_data = self.get_hrv_data(cdate)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rhr_future = executor.submit(self.get_rhr_day, cdate)
+            hrv_future = executor.submit(self.get_hrv_data, cdate)
+            rhr_data = rhr_future.result()
+            hrv_data = hrv_future.result()
         logger.debug(f"Heart rate data - RHR: {rhr_data}, HRV: {hrv_data}")
         return UserFitnessDataParser.parse_heart_rate_data(rhr_data, hrv_data)
 
@@ -823,12 +1244,8 @@ class Garmin:
         url = f"/metrics-service/metrics/trainingreadiness/{cdate}"
         logger.debug("Requesting training readiness data")
 
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=list)
         logger.debug(f"Training readiness response: {response}")
-        if not isinstance(response, list):
-            raise GarminConnectConnectionError(
-                f"Expected list response from {url}, got {type(response)}"
-            )
         return UserFitnessDataParser.parse_training_readiness(response)
 
     def get_endurance_score(self, startdate: str, enddate=None) -> EnduranceData:
@@ -882,19 +1299,14 @@ class Garmin:
             raise ValueError("results: _type must be one of %r." % valid)
 
         if _type is None and startdate is None and enddate is None:
-            url = (
-                self.garmin_connect_race_predictor_url + f"/latest/{self.display_name}"
-            )
+            url = self._url_race_predictions_latest
             response = self.connectapi(url)
 
         elif _type is not None and startdate is not None and enddate is not None:
             url = (
                 self.garmin_connect_race_predictor_url + f"/{_type}/{self.display_name}"
             )
-            params = {
-                "fromCalendarDate": str(startdate),
-                "toCalendarDate": str(enddate),
-            }
+            params = _params(fromCalendarDate=startdate, toCalendarDate=enddate)
             response = self.connectapi(url, params=params)
 
         else:
@@ -909,12 +1321,8 @@ class Garmin:
         url = f"/metrics-service/metrics/trainingstatus/aggregated/{cdate}"
         logger.debug("Requesting training status data")
 
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=dict)
         logger.debug(f"Training status response: {response}")
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
         return UserFitnessDataParser.parse_training_status(response)
 
     def get_fitnessage_data(self, cdate: str) -> Dict[str, Any]:
@@ -923,12 +1331,7 @@ class Garmin:
         url = f"/fitnessage-service/fitnessage/{cdate}"
         logger.debug("Requesting Fitness Age data")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_hill_score(self, startdate: str, enddate=None):
         """
@@ -959,12 +1362,8 @@ class Garmin:
         """Return available devices for the current user account."""
         logger.debug("Requesting devices")
         url = "/device-service/deviceregistration/devices"
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=dict)
         logger.debug(response)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
         return response.get("devices", [])
 
     def get_device_settings(self, device_id: str) -> Dict[str, Any]:
@@ -973,12 +1372,9 @@ class Garmin:
         url = f"/device-service/deviceservice/device-info/settings/{device_id}"
         logger.debug("Requesting device settings")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        # Settings and alarms change on the device itself, so nothing here
+        # invalidates them; reuse them for as long as the disk cache does
+        return self.connectapi(url, memo_ttl=DEVICE_TTL, expect=dict)
 
     def get_primary_training_device(self) -> Dict[str, Any]:
         """Return detailed information around primary training devices, included the specified device and the
@@ -988,12 +1384,7 @@ class Garmin:
         url = "/web-gateway/device-info/primary-training-device"
         logger.debug("Requesting primary training device information")
 
-        response = self.connectapi(url)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
-        return response
+        return self.connectapi(url, expect=dict)
 
     def get_device_solar_data(
         self, device_id: str, startdate: str, enddate=None
@@ -1009,11 +1400,7 @@ class Garmin:
 
         url = f"/web-gateway/solar/{device_id}/{startdate}/{enddate}"
 
-        response = self.connectapi(url, params=params)
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
+        response = self.connectapi(url, params=params, expect=dict)
         if "deviceSolarInput" not in response:
             raise GarminConnectConnectionError(
                 f"Expected 'deviceSolarInput' key in response from {url}"
@@ -1025,14 +1412,20 @@ class Garmin:
 
         logger.debug("Requesting device alarms")
 
-        alarms = []
         devices = self.get_devices()
-        for device in devices:
-            device_settings = self.get_device_settings(device["deviceId"])
-            device_alarms = device_settings["alarms"]
-            if device_alarms is not None:
-                alarms += device_alarms
-        return alarms
+        if not devices:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            settings_list = executor.map(
+                lambda device: self.get_device_settings(device["deviceId"]),
+                devices,
+            )
+            return [
+                alarm
+                for device_settings in settings_list
+                for alarm in (device_settings["alarms"] or [])
+            ]
 
     def get_device_last_used(self):
         """Return device last used."""
@@ -1054,9 +1447,7 @@ class Garmin:
         """
 
         url = self.garmin_connect_activities
-        params = {"start": str(start), "limit": str(limit)}
-        if activitytype:
-            params["activityType"] = str(activitytype)
+        params = _params(start=start, limit=limit, activityType=activitytype)
 
         logger.debug("Requesting activities")
 
@@ -1077,7 +1468,10 @@ class Garmin:
         url = f"{self.garmin_connect_activity}/{activity_id}"
         payload = {"activityId": activity_id, "activityName": title}
 
-        return self.garth.put("connectapi", url, json=payload, api=True)
+        response = self.garth.put("connectapi", url, json=payload, api=True)
+        self._invalidate_cache(url)
+        self._invalidate_cache(self.garmin_connect_activities)
+        return response
 
     def set_activity_type(self, activity_id, type_id, type_key, parent_type_id):
         url = f"{self.garmin_connect_activity}/{activity_id}"
@@ -1090,12 +1484,17 @@ class Garmin:
             },
         }
         logger.debug(f"Changing activity type: {str(payload)}")
-        return self.garth.put("connectapi", url, json=payload, api=True)
+        response = self.garth.put("connectapi", url, json=payload, api=True)
+        self._invalidate_cache(url)
+        self._invalidate_cache(self.garmin_connect_activities)
+        return response
 
     def create_manual_activity_from_json(self, payload):
         url = f"{self.garmin_connect_activity}"
         logger.debug(f"Uploading manual activity: {str(payload)}")
-        return self.garth.post("connectapi", url, json=payload, api=True)
+        response = self.garth.post("connectapi", url, json=payload, api=True)
+        self._invalidate_cache(self.garmin_connect_activities)
+        return response
 
     def create_manual_activity(
         self,
@@ -1136,10 +1535,19 @@ class Garmin:
         """Return last activity."""
 
         activities = self.get_activities(0, 1)
-        if activities:
-            return activities[-1]
-
-        return None
+        if not activities:
+            return None
+
+        activity = activities[-1]
+        if self.prefetch:
+            # Callers usually drill into the activity next
+            for fetch in (
+                self.get_activity,
+                self.get_activity_splits,
+                self.get_activity_weather,
+            ):
+                self._prefetch(fetch, activity["activityId"])
+        return activity
 
     def upload_activity(self, activity_path: str):
         """Upload activity in fit format from file."""
@@ -1152,11 +1560,18 @@ class Garmin:
         )
 
         if allowed_file_extension:
-            files = {
-                "file": (file_base_name, open(activity_path, "rb" or "r")),
-            }
             url = "/upload-service/upload"
-            return self.garth.post("connectapi", url, files=files, api=True)
+            with open(activity_path, "rb") as activity_file:
+                files = {
+                    "file": (
+                        file_base_name,
+                        activity_file,
+                        "application/octet-stream",
+                    ),
+                }
+                response = self.garth.post("connectapi", url, files=files, api=True)
+            self._invalidate_cache(self.garmin_connect_activities)
+            return response
         else:
             raise GarminConnectInvalidFileFormatError(
                 f"Could not upload {activity_path}"
@@ -1168,12 +1583,15 @@ class Garmin:
         url = f"/activity-service/activity/{activity_id}"
         logger.debug("Deleting activity with id %s", activity_id)
 
-        return self.garth.request(
+        response = self.garth.request(
             "DELETE",
             "connectapi",
             url,
             api=True,
         )
+        self._invalidate_cache(url)
+        self._invalidate_cache(self.garmin_connect_activities)
+        return response
 
     def get_activities_by_date(
         self, startdate, enddate=None, activitytype=None, sortorder=None
@@ -1190,37 +1608,60 @@ class Garmin:
         :return: list of JSON activities
         """
 
-        activities = []
         start = 0
         limit = 20
         # mimicking the behavior of the web interface that fetches
         # 20 activities at a time
         # and automatically loads more on scroll
         url = self.garmin_connect_activities
-        params = {
-            "startDate": str(startdate),
-            "start": str(start),
-            "limit": str(limit),
-        }
-        if enddate:
-            params["endDate"] = str(enddate)
-        if activitytype:
-            params["activityType"] = str(activitytype)
-        if sortorder:
-            params["sortOrder"] = str(sortorder)
+        # start and limit are filled in per page by _fetch_pages
+        params = _params(
+            startDate=startdate,
+            endDate=enddate,
+            activityType=activitytype,
+            sortOrder=sortorder,
+        )
 
         logger.debug(f"Requesting activities by date from {startdate} to {enddate}")
-        while True:
-            params["start"] = str(start)
-            logger.debug(f"Requesting activities {start} to {start+limit}")
-            act = self.connectapi(url, params=params)
-            if act:
-                activities.extend(act)
-                start = start + limit
-            else:
-                break
+        pages = self._fetch_pages(url, params, start, limit)
+        return list(chain.from_iterable(pages))
+
+    def _fetch_pages(
+        self, url: str, params: Dict[str, Any], start: int, limit: int
+    ) -> List[Any]:
+        """
+        Return the pages of a start/limit paginated endpoint, in order.
+
+        The next page is always requested while the current one is in flight;
+        paging stops at the first short or empty page and the speculative
+        request beyond it is abandoned.
+        """
 
-        return activities
+        def fetch(page_start: int) -> Dict[str, Any] | List[Any]:
+            logger.debug(f"Requesting {url} items {page_start} to {page_start + limit}")
+            page_params = {**params, "start": str(page_start), "limit": str(limit)}
+            return self.connectapi(url, params=page_params)
+
+        pages = []
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            pending = [
+                executor.submit(fetch, start),
+                executor.submit(fetch, start + limit),
+            ]
+            next_start = start + 2 * limit
+            while True:
+                page = pending.pop(0).result()
+                if not page:
+                    break
+                pages.append(page)
+                if len(page) < limit:
+                    break
+                pending.append(executor.submit(fetch, next_start))
+                next_start += limit
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return pages
 
     def get_progress_summary_between_dates(
         self, startdate, enddate, metric="distance", groupbyactivities=True
@@ -1236,13 +1677,13 @@ class Garmin:
         """
 
         url = "/fitnessstats-service/activity"
-        params = {
-            "startDate": str(startdate),
-            "endDate": str(enddate),
-            "aggregation": "lifetime",
-            "groupByParentActivityType": str(groupbyactivities),
-            "metric": str(metric),
-        }
+        params = _params(
+            startDate=startdate,
+            endDate=enddate,
+            aggregation="lifetime",
+            groupByParentActivityType=groupbyactivities,
+            metric=metric,
+        )
 
         logger.debug(f"Requesting fitnessstats by date from {startdate} to {enddate}")
         return self.connectapi(url, params=params)
@@ -1250,7 +1691,7 @@ class Garmin:
     def get_activity_types(self):
         url = "/activity-service/activity/activityTypes"
         logger.debug("Requesting activity types")
-        return self.connectapi(url)
+        return self.connectapi(url, memo_ttl=None)
 
     def get_goals(self, status="active", start=1, limit=30) -> GoalsData:
         """
@@ -1266,25 +1707,13 @@ class Garmin:
 
         goals: List[Dict[str, Any]] = []
         url = "/goal-service/goal/goals"
-        params = {
-            "status": status,
-            "start": str(start),
-            "limit": str(limit),
-            "sortOrder": "asc",
-        }
+        params = _params(status=status, sortOrder="asc")
 
         logger.debug(f"Requesting {status} goals")
-        while True:
-            params["start"] = str(start)
-            logger.debug(f"Requesting {status} goals {start} to {start + limit - 1}")
-            goals_json = self.connectapi(url, params=params)
-            if goals_json:
-                logger.debug(f"Goals response: {goals_json}")
-                if isinstance(goals_json, list):
-                    goals.extend(goals_json)
-                start = start + limit
-            else:
-                break
+        for goals_json in self._fetch_pages(url, params, start, limit):
+            logger.debug(f"Goals response: {goals_json}")
+            if isinstance(goals_json, list):
+                goals.extend(goals_json)
 
         return UserFitnessDataParser.parse_goals_data(goals)
 
@@ -1315,16 +1744,18 @@ class Garmin:
             f"{self.garmin_connect_gear_baseurl}{gearUUID}/"
             f"activityType/{activityType}{defaultGearString}"
         )
-        return self.garth.request(method_override, "connectapi", url, api=True)
+        response = self.garth.request(method_override, "connectapi", url, api=True)
+        self._invalidate_cache(self.garmin_connect_gear_baseurl)
+        return response
 
-    class ActivityDownloadFormat(Enum):
-        """Activity variables."""
+    class ActivityDownloadFormat(str, Enum):
+        """Activity download formats, valued by their URL template."""
 
-        ORIGINAL = auto()
-        TCX = auto()
-        GPX = auto()
-        KML = auto()
-        CSV = auto()
+        ORIGINAL = "/download-service/files/activity/{}"
+        TCX = "/download-service/export/tcx/activity/{}"
+        GPX = "/download-service/export/gpx/activity/{}"
+        KML = "/download-service/export/kml/activity/{}"
+        CSV = "/download-service/export/csv/activity/{}"
 
     class ActivityUploadFormat(Enum):
         FIT = auto()
@@ -1337,17 +1768,9 @@ class Garmin:
         "Original" will return the zip file content, up to user to extract it.
         "CSV" will return a csv of the splits.
         """
-        activity_id = str(activity_id)
-        urls = {
-            Garmin.ActivityDownloadFormat.ORIGINAL: f"/download-service/files/activity/{activity_id}",
-            Garmin.ActivityDownloadFormat.TCX: f"/download-service/export/tcx/activity/{activity_id}",
-            Garmin.ActivityDownloadFormat.GPX: f"/download-service/export/gpx/activity/{activity_id}",
-            Garmin.ActivityDownloadFormat.KML: f"/download-service/export/kml/activity/{activity_id}",
-            Garmin.ActivityDownloadFormat.CSV: f"/download-service/export/csv/activity/{activity_id}",
-        }
-        if dl_fmt not in urls:
+        if not isinstance(dl_fmt, Garmin.ActivityDownloadFormat):
             raise ValueError(f"Unexpected value {dl_fmt} for dl_fmt")
-        url = urls[dl_fmt]
+        url = dl_fmt.value.format(activity_id)
 
         logger.debug("Downloading activities from %s", url)
 
@@ -1360,7 +1783,7 @@ class Garmin:
         url = f"{self.garmin_connect_activity}/{activity_id}/splits"
         logger.debug("Requesting splits for activity id %s", activity_id)
 
-        return self.connectapi(url)
+        return self.connectapi(url, memo_ttl=ACTIVITY_TTL)
 
     def get_activity_typed_splits(self, activity_id):
         """Return typed activity splits. Contains similar info to `get_activity_splits`, but for certain activity types
@@ -1370,7 +1793,7 @@ class Garmin:
         url = f"{self.garmin_connect_activity}/{activity_id}/typedsplits"
         logger.debug("Requesting typed splits for activity id %s", activity_id)
 
-        return self.connectapi(url)
+        return self.connectapi(url, memo_ttl=ACTIVITY_TTL)
 
     def get_activity_split_summaries(self, activity_id):
         """Return activity split summaries."""
@@ -1379,7 +1802,7 @@ class Garmin:
         url = f"{self.garmin_connect_activity}/{activity_id}/split_summaries"
         logger.debug("Requesting split summaries for activity id %s", activity_id)
 
-        return self.connectapi(url)
+        return self.connectapi(url, memo_ttl=ACTIVITY_TTL)
 
     def get_activity_weather(self, activity_id):
         """Return activity weather."""
@@ -1406,7 +1829,7 @@ class Garmin:
         url = f"{self.garmin_connect_activity}/{activity_id}"
         logger.debug("Requesting activity summary data for activity id %s", activity_id)
 
-        return self.connectapi(url)
+        return self.connectapi(url, memo_ttl=ACTIVITY_TTL)
 
     def get_activity_details(self, activity_id, maxchart=2000, maxpoly=4000):
         """Return activity details."""
@@ -1461,12 +1884,8 @@ class Garmin:
         url = self.garmin_connect_user_settings_url
         logger.debug("Requesting user profile.")
 
-        response = self.connectapi(url)
+        response = self.connectapi(url, expect=dict)
         logger.debug(f"User profile response: {response}")
-        if not isinstance(response, dict):
-            raise GarminConnectConnectionError(
-                f"Expected dict response from {url}, got {type(response)}"
-            )
 
         return UserProfileParser.parse_user_profile(response)
 
@@ -1487,7 +1906,11 @@ class Garmin:
         url = f"/wellness-service/wellness/epoch/request/{cdate}"
         logger.debug(f"Requesting reload of data for {cdate}.")
 
-        return self.garth.post("connectapi", url, api=True)
+        response = self.garth.post("connectapi", url, api=True)
+        # Responses for past days are cached forever, and the ones for cdate
+        # may have been stored before Garmin restored its data
+        self._invalidate_date(cdate)
+        return response
 
     # TODO add filters by sport.
     def get_workouts(self, start=0, end=100) -> List[WorkoutOverview]:
@@ -1496,14 +1919,9 @@ class Garmin:
         url = f"{self.garmin_workouts}/workouts"
         logger.debug(f"Requesting workouts from {start}-{end}")
         params = {"start": start, "limit": end}
-        response = self.connectapi(url, params=params)
+        response = self.connectapi(url, params=params, expect=list)
         logger.debug(f"Workouts response: {response}")
 
-        if not isinstance(response, list):
-            raise GarminConnectConnectionError(
-                f"Expected list response from {url}, got {type(response)}"
-            )
-
         return [
             WorkoutParser.parse_workout_overview(workout_data)
             for workout_data in response
@@ -1524,30 +1942,22 @@ class Garmin:
             "myWorkoutsOnly": False,
             "sharedWorkoutsOnly": False,
         }
-        response = self.connectapi(url, params=params)
+        response = self.connectapi(url, params=params, expect=list)
         logger.debug(f"Workouts response: {response}")
 
-        if not isinstance(response, list):
-            raise GarminConnectConnectionError(
-                f"Expected list response from {url}, got {type(response)}"
-            )
-
-        workouts = [
+        # Filter by provider ID on the raw JSON so other workouts are never parsed
+        return [
             WorkoutParser.parse_workout_overview(workout_data)
             for workout_data in response
+            if workout_data.get("workoutSourceId") == source_id
         ]
-        # Filter workouts by provider ID
-        filtered_workouts = [w for w in workouts if w.workout_source_id == source_id]
-
-        return filtered_workouts
 
     def get_workout_by_id(self, workout_id) -> WorkoutDetail:
         """Return workout by id."""
 
         url = f"{self.garmin_workouts}/workout/{workout_id}"
-        resp = self.connectapi(url)
+        resp = self.connectapi(url, memo_ttl=MUTABLE_RESPONSE_TTL, expect=dict)
         logger.debug(f"Workout by ID response: {resp}")
-        assert isinstance(resp, dict)
         return WorkoutParser.parse_workout(resp)
 
     def download_workout(self, workout_id):
@@ -1566,14 +1976,18 @@ class Garmin:
         url = f"{self.garmin_workouts}/workout"
         logger.debug("Uploading workout using %s", url)
 
-        return self.garth.post("connectapi", url, json=workout.to_dict(), api=True)
+        response = self.garth.post("connectapi", url, json=workout.to_dict(), api=True)
+        self._invalidate_cache(self.garmin_workouts)
+        return response
 
     def update_workout(self, workout_id: str, workout: WorkoutDetail):
         """Update an existing workout using json data."""
         url = f"{self.garmin_workouts}/workout/{workout_id}"
         logger.debug("Updating workout %s using %s", workout_id, url)
 
-        return self.garth.put("connectapi", url, json=workout.to_dict(), api=True)
+        response = self.garth.put("connectapi", url, json=workout.to_dict(), api=True)
+        self._invalidate_cache(self.garmin_workouts)
+        return response
 
     def schedule_workout(
         self, workout_id: str, workout: WorkoutDetail
@@ -1586,9 +2000,9 @@ class Garmin:
         payload = {"date": date_str}
         logger.debug("Scheduling workout %s for date %s", workout_id, date_str)
 
-        return WorkoutParser.parse_workout(
-            self.garth.post("connectapi", url, json=payload, api=True).json()
-        )
+        response = self.garth.post("connectapi", url, json=payload, api=True)
+        self._invalidate_cache(self.garmin_workouts)
+        return WorkoutParser.parse_workout(response.json())
 
     def delete_workout(self, workout_id: str):
         """Delete workout by id."""
@@ -1596,13 +2010,15 @@ class Garmin:
         url = f"{self.garmin_workouts}/workout/{workout_id}"
         logger.debug("Deleting workout with id %s", workout_id)
 
-        return self.garth.request(
+        response = self.garth.request(
             "POST",
             "connectapi",
             url,
             headers={"x-http-method-override": "DELETE"},
             api=True,
         )
+        self._invalidate_cache(self.garmin_workouts)
+        return response
 
     def get_menstrual_data_for_date(self, fordate: str):
         """Return menstrual data for date."""
@@ -1641,6 +2057,45 @@ class Garmin:
             "connectapi", "graphql-gateway/graphql", json=query
         ).json()
 
+    def get_range(
+        self,
+        metric: str,
+        start: date | str,
+        end: date | str,
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Return a metric for every day from start to end inclusive, keyed by
+        'YYYY-MM-DD'.
+
+        Metrics with a range endpoint (see _RANGE_METRICS) cost one request;
+        the rest (see _DAILY_METRICS) are fetched per day on a thread pool.
+        """
+        start_date = date.fromisoformat(str(start))
+        end_date = date.fromisoformat(str(end))
+        if end_date < start_date:
+            raise ValueError(f"End date {end_date} is before start date {start_date}")
+
+        if metric in _RANGE_METRICS:
+            method_name, date_field = _RANGE_METRICS[metric]
+            response = getattr(self, method_name)(
+                start_date.isoformat(), end_date.isoformat()
+            )
+            return {item[date_field]: item for item in response}
+
+        if metric not in _DAILY_METRICS:
+            raise ValueError(
+                f"Unknown metric {metric!r}, expected one of "
+                f"{sorted(_RANGE_METRICS) + sorted(_DAILY_METRICS)}"
+            )
+        fetcher = getattr(self, _DAILY_METRICS[metric])
+        days = [
+            (start_date + timedelta(days=i)).isoformat()
+            for i in range((end_date - start_date).days + 1)
+        ]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return dict(zip(days, executor.map(fetcher, days)))
+
     def get_comprehensive_fitness_data(
         self, limit_activities: int = 15
     ) -> UserFitnessData:
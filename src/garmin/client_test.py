@@ -0,0 +1,460 @@
+"""
+Unit tests for Garmin client helpers that do not need a Garmin account.
+
+Client tests swap garth's request() for FakeConnect, so every request the
+client makes is answered locally and recorded.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+import requests
+from garth.exc import GarthHTTPError
+
+sys.path.insert(0, "src")
+
+from garmin import client as client_module
+from garmin import rate_limit
+from garmin.cache import CachePolicy, LRUCache, ResponseCache, cache_ttl
+from garmin.client import (
+    Garmin,
+    GarminConnectConnectionError,
+    GarminConnectTooManyRequestsError,
+    _fmt_ts,
+    _write_private,
+)
+from garmin.rate_limit import TokenBucket
+
+ACTIVITIES_URL = Garmin.garmin_connect_activities
+
+
+def _days_ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+class FakeConnect:
+    """Stands in for garth.Client.request, answering every call from handler.
+
+    handler(path, params, headers) returns a response body, or a
+    (status, body, headers) tuple. Statuses >= 400 raise GarthHTTPError the
+    way garth does.
+    """
+
+    def __init__(self, handler: Callable[..., Any], delay: float = 0.0):
+        self.handler = handler
+        self.delay = delay
+        self.calls: List[Tuple[str, Dict[str, Any], Dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        method: str,
+        subdomain: str,
+        path: str,
+        api: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        with self._lock:
+            self.calls.append((path, dict(params or {}), dict(headers or {})))
+        if self.delay:
+            time.sleep(self.delay)
+        answer = self.handler(path, params or {}, headers or {})
+        status, body, response_headers = (
+            answer if isinstance(answer, tuple) else (200, answer, {})
+        )
+        response = requests.Response()
+        response.status_code = status
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.headers.update(response_headers)
+        if status >= 400:
+            raise GarthHTTPError(
+                msg="Error in request", error=requests.HTTPError(response=response)
+            )
+        return response
+
+
+def make_client(
+    handler: Callable[..., Any], delay: float = 0.0, **kwargs: Any
+) -> Tuple[Garmin, FakeConnect]:
+    kwargs.setdefault("requests_per_minute", None)
+    garmin = Garmin("user@example.com", "password", **kwargs)
+    fake = FakeConnect(handler, delay)
+    garmin.garth.request = fake
+    return garmin, fake
+
+
+def test_fmt_ts_matches_truncated_isoformat() -> None:
+    """_fmt_ts keeps the payload format previously built by slicing isoformat()."""
+    naive = datetime(2024, 3, 5, 7, 8, 9, 123456)
+    aware = naive.replace(tzinfo=timezone(timedelta(hours=-5)))
+    for dt in (naive, aware, aware.astimezone(timezone.utc)):
+        assert _fmt_ts(dt) == dt.isoformat()[:19] + ".00"
+
+
+def test_fmt_ts_without_microseconds() -> None:
+    assert _fmt_ts(datetime(2024, 1, 1)) == "2024-01-01T00:00:00.00"
+
+
+def test_write_private_replaces_the_file_owner_only(tmp_path: Any) -> None:
+    path = tmp_path / "tokens" / "garth.json"
+    _write_private(str(path), "old")
+    _write_private(str(path), "new")
+    assert path.read_text() == "new"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(path.parent) == ["garth.json"]
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 1
+
+
+def test_lru_cache_expired_entries_stay_available_as_stale() -> None:
+    cache = LRUCache()
+    cache.set("a", 1, ttl=-1)
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == 1
+
+
+def test_lru_cache_invalidates_by_path_prefix() -> None:
+    cache = LRUCache()
+    cache.set(("/weight-service/weight/range", ()), 1)
+    cache.set(("/weight-service/weight/day", (("date", "x"),)), 2)
+    cache.set(("/sleep-service/sleep", ()), 3)
+    cache.invalidate("/weight-service/")
+    assert len(cache) == 1
+    assert cache.get(("/sleep-service/sleep", ())) == 3
+
+
+def test_response_cache_persists_expires_and_invalidates(tmp_path: Any) -> None:
+    cache = ResponseCache(str(tmp_path))
+    cache.set("k1", "/activity-service/activity/1", {"a": 1}, None, etag='"v1"')
+    cache.set("k2", "/activity-service/activity/2", [2], -1)
+    cache.set("k3", "/sleep-service/sleep", {"s": 3}, 60)
+
+    reopened = ResponseCache(str(tmp_path))
+    assert reopened.get("k1") == {"a": 1}
+    assert reopened.entry("k1") == ({"a": 1}, True, '"v1"', None)
+    assert reopened.get("k2") is None
+    expired = reopened.entry("k2")
+    assert expired is not None and not expired.fresh
+
+    reopened.invalidate("/activity-service/")
+    assert reopened.entry("k1") is None and reopened.entry("k2") is None
+    assert reopened.get("k3") == {"s": 3}
+
+
+def test_cache_ttl_keeps_only_settled_days_forever() -> None:
+    assert cache_ttl(f"/wellness-service/daily/{_days_ago(10)}", {}) is None
+    closed = {"startDate": _days_ago(30), "endDate": _days_ago(20)}
+    assert cache_ttl(ACTIVITIES_URL, closed) is None
+    # Recent days are still being filled in, and open ranges grow
+    assert cache_ttl(f"/wellness-service/daily/{_days_ago(1)}", {}) == 300
+    assert cache_ttl(ACTIVITIES_URL, {"startDate": _days_ago(30)}) == 300
+    assert cache_ttl("/device-service/deviceregistration/devices", {}) == 3600
+    assert cache_ttl("/usersummary-service/usersummary/daily/x", {}) == 300
+
+
+def test_cached_responses_are_copied_per_caller() -> None:
+    garmin, fake = make_client(lambda path, params, headers: {"n": {"a": [1]}})
+    first = garmin.connectapi("/p", expect=dict)
+    first["n"]["a"].append(2)
+    assert garmin.connectapi("/p") == {"n": {"a": [1]}}
+    assert len(fake.calls) == 1
+
+
+def test_use_cache_false_always_fetches() -> None:
+    garmin, fake = make_client(lambda path, params, headers: {"n": 1})
+    garmin.connectapi("/p")
+    garmin.connectapi("/p", use_cache=False)
+    assert len(fake.calls) == 2
+
+
+def test_expect_rejects_other_shapes() -> None:
+    garmin, _ = make_client(lambda path, params, headers: [1])
+    with pytest.raises(GarminConnectConnectionError):
+        garmin.connectapi("/p", expect=dict)
+
+
+def test_replay_policy_fails_on_misses_without_requests(tmp_path: Any) -> None:
+    garmin, fake = make_client(
+        lambda path, params, headers: {},
+        cache_dir=str(tmp_path),
+        cache_policy=CachePolicy.REPLAY,
+    )
+    with pytest.raises(GarminConnectConnectionError):
+        garmin.connectapi("/p")
+    assert fake.calls == []
+
+
+def test_replay_policy_serves_expired_disk_entries(tmp_path: Any) -> None:
+    garmin, fake = make_client(
+        lambda path, params, headers: {},
+        cache_dir=str(tmp_path),
+        cache_policy="replay",
+    )
+    disk = garmin._disk_cache
+    assert disk is not None
+    disk.set(garmin._disk_cache_key("/p", {"x": "1"}), "/p", {"n": 1}, -1)
+    assert garmin.connectapi("/p", params={"x": "1"}) == {"n": 1}
+    assert fake.calls == []
+
+
+def _revalidating_handler(path: str, params: Any, headers: Dict[str, str]) -> Any:
+    if headers.get("If-None-Match") == '"v1"':
+        return 304, None, {}
+    return 200, {"n": 1}, {"ETag": '"v1"'}
+
+
+def test_expired_memo_entries_are_revalidated() -> None:
+    garmin, fake = make_client(_revalidating_handler)
+    assert garmin.connectapi("/p", memo_ttl=-1) == {"n": 1}
+    assert garmin.connectapi("/p", memo_ttl=-1) == {"n": 1}
+    assert [call[2] for call in fake.calls] == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_expired_disk_entries_are_revalidated(tmp_path: Any) -> None:
+    garmin, fake = make_client(_revalidating_handler, cache_dir=str(tmp_path))
+    disk = garmin._disk_cache
+    assert disk is not None
+    key = garmin._disk_cache_key("/p", {})
+    disk.set(key, "/p", {"n": 1}, -1, etag='"v1"')
+
+    assert garmin.connectapi("/p", memo_ttl=0) == {"n": 1}
+    assert fake.calls[0][2] == {"If-None-Match": '"v1"'}
+    assert disk.get(key) == {"n": 1}
+
+
+class FakeClock:
+    """Replaces time.monotonic/time.sleep so waits advance time instantly."""
+
+    def __init__(self, monkeypatch: Any):
+        self.now = 0.0
+        self.sleeps: List[float] = []
+        monkeypatch.setattr(client_module.time, "monotonic", lambda: self.now)
+        monkeypatch.setattr(client_module.time, "sleep", self.sleep)
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_server_errors_are_retried_with_backoff(monkeypatch: Any) -> None:
+    clock = FakeClock(monkeypatch)
+    statuses = iter([503, 502, 200])
+    garmin, fake = make_client(
+        lambda path, params, headers: (next(statuses), {"n": 1}, {}),
+        retry_base_delay=1,
+    )
+    assert garmin.connectapi("/p") == {"n": 1}
+    assert len(fake.calls) == 3
+    assert 1 <= clock.sleeps[0] <= 2 and 2 <= clock.sleeps[1] <= 3
+
+
+def test_retries_stop_at_the_retry_budget(monkeypatch: Any) -> None:
+    clock = FakeClock(monkeypatch)
+    garmin, fake = make_client(
+        lambda path, params, headers: (503, None, {}),
+        retry_base_delay=4,
+        retry_budget=10,
+    )
+    with pytest.raises(GarthHTTPError):
+        garmin.connectapi("/p")
+    # The second wait (8s+) would end past the 10s budget, so it is skipped
+    assert len(clock.sleeps) == 1 and len(fake.calls) == 2
+
+
+def test_rate_limits_honour_retry_after_within_the_budget(monkeypatch: Any) -> None:
+    clock = FakeClock(monkeypatch)
+    garmin, fake = make_client(
+        lambda path, params, headers: (429, None, {"Retry-After": "7"}),
+        max_retries=1,
+    )
+    with pytest.raises(GarminConnectTooManyRequestsError):
+        garmin.connectapi("/p")
+    assert clock.sleeps == [7.0] and len(fake.calls) == 2
+
+    garmin, fake = make_client(
+        lambda path, params, headers: (429, None, {"Retry-After": "3600"})
+    )
+    clock.sleeps.clear()
+    with pytest.raises(GarminConnectTooManyRequestsError):
+        garmin.connectapi("/p")
+    assert clock.sleeps == [] and len(fake.calls) == 1
+
+
+def test_client_errors_are_not_retried() -> None:
+    garmin, fake = make_client(lambda path, params, headers: (404, None, {}))
+    with pytest.raises(GarthHTTPError):
+        garmin.connectapi("/p")
+    assert len(fake.calls) == 1
+
+
+def test_token_bucket_spaces_requests_beyond_the_burst(monkeypatch: Any) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+    for _ in range(4):
+        bucket.acquire()
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(1, abs=0.05)
+    assert sleeps[1] == pytest.approx(2, abs=0.05)
+
+
+def test_fetch_pages_keeps_order_and_stops_at_a_short_page() -> None:
+    def handler(path: str, params: Dict[str, str], headers: Any) -> Any:
+        start = int(params["start"])
+        size = 20 if start < 40 else 5
+        return [{"activityId": start + i} for i in range(size)]
+
+    garmin, fake = make_client(handler, delay=0.01)
+    activities = garmin.get_activities_by_date(_days_ago(30))
+    assert [a["activityId"] for a in activities] == list(range(45))
+    starts = sorted(int(call[1]["start"]) for call in fake.calls)
+    # At most one speculative request beyond the short page
+    assert starts[:3] == [0, 20, 40] and len(starts) <= 4
+    assert all(call[1]["limit"] == "20" for call in fake.calls)
+
+
+def test_fetch_pages_stops_at_an_empty_page() -> None:
+    def handler(path: str, params: Dict[str, str], headers: Any) -> Any:
+        return [{"id": 1}] * 20 if params["start"] == "0" else []
+
+    garmin, _ = make_client(handler)
+    assert len(garmin.get_activities_by_date(_days_ago(3), _days_ago(2))) == 20
+
+
+def test_concurrent_identical_reads_share_one_request() -> None:
+    garmin, fake = make_client(lambda path, params, headers: {"n": 1}, delay=0.2)
+    results: List[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(garmin.connectapi("/p")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [{"n": 1}] * 4
+    assert len(fake.calls) == 1
+    assert len({id(result) for result in results}) == 4
+
+
+def test_coalesced_callers_all_see_the_failure() -> None:
+    garmin, fake = make_client(lambda path, params, headers: (404, None, {}), 0.2)
+    errors: List[BaseException] = []
+
+    def read() -> None:
+        try:
+            garmin.connectapi("/p")
+        except GarthHTTPError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3 and len(fake.calls) == 1
+    assert garmin._inflight == {}
+
+
+def test_writes_invalidate_cached_reads(tmp_path: Any) -> None:
+    garmin, fake = make_client(
+        lambda path, params, headers: [{"activityId": 1}], cache_dir=str(tmp_path)
+    )
+    garmin.garth.put = lambda *args, **kwargs: None
+    garmin.get_activities()
+    garmin.get_activities()
+    assert len(fake.calls) == 1
+
+    garmin.set_activity_name(1, "Renamed")
+    garmin.get_activities()
+    assert len(fake.calls) == 2
+
+
+def test_reload_invalidates_only_responses_covering_the_date(tmp_path: Any) -> None:
+    garmin, fake = make_client(
+        lambda path, params, headers: {}, cache_dir=str(tmp_path)
+    )
+    garmin.garth.post = lambda *args, **kwargs: None
+    day, other = _days_ago(10), _days_ago(20)
+    reads = [
+        ("/usersummary/daily", {"calendarDate": day}),
+        ("/stats/steps", {"startDate": _days_ago(12), "endDate": _days_ago(8)}),
+        (f"/sleep/{other}", {}),
+    ]
+    for path, params in reads:
+        garmin.connectapi(path, params=params)
+    assert len(fake.calls) == 3
+
+    garmin.request_reload(day)
+    # Check the disk tier too, not just the in-memory one
+    garmin._response_cache.clear()
+    for path, params in reads:
+        garmin.connectapi(path, params=params)
+    assert [call[0] for call in fake.calls[3:]] == [
+        "/usersummary/daily",
+        "/stats/steps",
+    ]
+
+
+def test_close_shuts_down_the_prefetch_pool() -> None:
+    garmin, fake = make_client(lambda path, params, headers: {})
+    garmin._prefetch(lambda arg: None, None)
+    pool = garmin._prefetch_pool
+    assert pool is not None
+
+    garmin.__exit__(None, None, None)
+    assert garmin._prefetch_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+
+def test_get_range_uses_one_request_for_range_metrics() -> None:
+    start, end = _days_ago(5), _days_ago(4)
+    garmin, fake = make_client(
+        lambda path, params, headers: [
+            {"calendarDate": start, "totalSteps": 1},
+            {"calendarDate": end, "totalSteps": 2},
+        ]
+    )
+    steps = garmin.get_range("steps", start, end)
+    assert steps[end]["totalSteps"] == 2
+    assert [call[0] for call in fake.calls] == [
+        f"/usersummary-service/stats/steps/daily/{start}/{end}"
+    ]
+
+
+def test_get_range_fetches_daily_metrics_per_day() -> None:
+    garmin, fake = make_client(
+        lambda path, params, headers: {"day": path.rsplit("/", 1)[-1]}
+    )
+    days = [_days_ago(n) for n in (6, 5, 4)]
+    floors = garmin.get_range("floors", days[0], days[-1], concurrency=2)
+    assert list(floors) == days
+    assert all(floors[day] == {"day": day} for day in days)
+    assert len(fake.calls) == 3
+
+
+def test_get_range_rejects_bad_arguments() -> None:
+    garmin, fake = make_client(lambda path, params, headers: {})
+    with pytest.raises(ValueError):
+        garmin.get_range("floors", _days_ago(1), _days_ago(2))
+    with pytest.raises(ValueError):
+        garmin.get_range("nope", _days_ago(2), _days_ago(1))
+    assert fake.calls == []
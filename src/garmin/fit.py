@@ -203,7 +203,7 @@ class FitEncoder(Fit):
     LMSG_TYPE_DEVICE_INFO = 2
 
     def __init__(self):
-        self.buf = BytesIO()
+        self.buf: BytesIO = BytesIO()
         self.write_header()  # create header first
         self.device_info_defined = False
 
@@ -403,6 +403,11 @@ class FitEncoder(Fit):
     def getvalue(self):
         return self.buf.getvalue()
 
+    def stream(self) -> BytesIO:
+        """Return the underlying buffer rewound for reading, without copying it."""
+        self.buf.seek(0)
+        return self.buf
+
     def timestamp(self, t):
         """the timestamp in fit protocol is seconds since
         UTC 00:00 Dec 31 1989 (631065600)"""
@@ -8,6 +8,9 @@ from typing import Annotated
 
 CLAUDE_WORKOUT_SOURCE_ID = "77777777"
 
+# Minutes to cover one mile (1609.344 m) at 1 m/s
+_MINUTES_PER_MILE_AT_1_MPS = 1609.344 / 60
+
 
 class SportType(Enum):
     RUNNING = ("running", 1, 1)
@@ -175,9 +178,9 @@ class PaceZoneTarget(IntensityTarget):
         }
 
     def __str__(self) -> str:
-        # Convert from m/s to min/mile (1 mile = 1609.344 meters)
-        upper_min_mile = (1609.344 / self.upper_bound) / 60
-        lower_min_mile = (1609.344 / self.lower_bound) / 60
+        # Convert from m/s to min/mile
+        upper_min_mile = _MINUTES_PER_MILE_AT_1_MPS / self.upper_bound
+        lower_min_mile = _MINUTES_PER_MILE_AT_1_MPS / self.lower_bound
 
         def format_pace(pace_min_mile):
             mins = int(pace_min_mile)
@@ -251,26 +254,18 @@ class WorkoutStep(BaseModel):
         result["stepAudioNote"] = None
 
         # intensity
-        if (
-            hasattr(self.intensity, "lower_bound")
-            and getattr(self.intensity, "lower_bound", None) is not None
-        ):
-            result["targetValueOne"] = getattr(self.intensity, "lower_bound")
-        if (
-            hasattr(self.intensity, "upper_bound")
-            and getattr(self.intensity, "upper_bound", None) is not None
-        ):
-            result["targetValueTwo"] = getattr(self.intensity, "upper_bound")
-        if (
-            hasattr(self.intensity, "target_value_unit")
-            and getattr(self.intensity, "target_value_unit", None) is not None
-        ):
-            result["targetValueUnit"] = getattr(self.intensity, "target_value_unit")
-        if (
-            hasattr(self.intensity, "zone_number")
-            and getattr(self.intensity, "zone_number", None) is not None
-        ):
-            result["zoneNumber"] = getattr(self.intensity, "zone_number")
+        lower_bound = getattr(self.intensity, "lower_bound", None)
+        if lower_bound is not None:
+            result["targetValueOne"] = lower_bound
+        upper_bound = getattr(self.intensity, "upper_bound", None)
+        if upper_bound is not None:
+            result["targetValueTwo"] = upper_bound
+        target_value_unit = getattr(self.intensity, "target_value_unit", None)
+        if target_value_unit is not None:
+            result["targetValueUnit"] = target_value_unit
+        zone_number = getattr(self.intensity, "zone_number", None)
+        if zone_number is not None:
+            result["zoneNumber"] = zone_number
 
         return result
 
@@ -301,7 +296,7 @@ class WorkoutSegment(BaseModel):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     user_profile_pk: Optional[int] = None
     display_name: Optional[str] = None
@@ -313,7 +308,7 @@ class Author:
     vivokid_user: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EstimatedDistanceUnit:
     unit_key: Optional[str] = None
 
@@ -321,7 +316,7 @@ class EstimatedDistanceUnit:
         return {"unitKey": self.unit_key}
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutOverview:
     """Represents a workout overview as returned by Garmin Connect API"""
 
@@ -0,0 +1,37 @@
+"""Client-side request throttling for the Garmin Connect client."""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate per minute.
+
+    Up to ``capacity`` requests may go out back to back; beyond that callers
+    are spaced out to the refill rate instead of running into Garmin's 429s.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60
+        # Default burst: ten seconds' worth of requests
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate * 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve now so concurrent callers queue behind each other
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
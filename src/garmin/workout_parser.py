@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 from .models.workout import (
     SportType,
     EndConditionType,
@@ -18,6 +18,54 @@ from .models.workout import (
 )
 from .models.run_workout import RunWorkout
 
+_STEP_TYPE_MAP = {
+    "warmup": StepType.WARMUP,
+    "cooldown": StepType.COOLDOWN,
+    "interval": StepType.INTERVAL,
+    "recovery": StepType.RECOVERY,
+    "rest": StepType.REST,
+    # "other": StepType.OTHER,
+}
+
+_CONDITION_MAP = {
+    "lap.button": EndConditionType.LAP_BUTTON,
+    "time": EndConditionType.TIME,
+    "distance": EndConditionType.DISTANCE,
+    "calories": EndConditionType.CALORIES,
+}
+
+
+def _parse_cadence_target(step_data: Dict[str, Any]) -> IntensityTargetType:
+    lower = step_data.get("targetValueOne")
+    upper = step_data.get("targetValueTwo")
+    if lower is not None and upper is not None:
+        return CadenceTarget(lower_bound=lower, upper_bound=upper)
+    return NoTarget()
+
+
+def _parse_heart_rate_zone_target(step_data: Dict[str, Any]) -> IntensityTargetType:
+    zone = step_data.get("zoneNumber")
+    if zone is not None:
+        return HeartRateZoneTarget(zone_number=zone)
+    return NoTarget()
+
+
+def _parse_pace_zone_target(step_data: Dict[str, Any]) -> IntensityTargetType:
+    upper = step_data.get("targetValueOne")
+    lower = step_data.get("targetValueTwo")
+    if lower is not None and upper is not None:
+        return PaceZoneTarget(lower_bound=lower, upper_bound=upper)
+    return NoTarget()
+
+
+# Keyed by Garmin's workoutTargetTypeKey. Unknown keys fall back to NoTarget.
+_TARGET_PARSERS: Dict[str, Callable[[Dict[str, Any]], IntensityTargetType]] = {
+    "no.target": lambda step_data: NoTarget(),
+    "cadence": _parse_cadence_target,
+    "heart.rate.zone": _parse_heart_rate_zone_target,
+    "pace.zone": _parse_pace_zone_target,
+}
+
 
 class WorkoutParser:
     """Parser to convert Garmin API workout JSON to RunWorkout objects"""
@@ -26,17 +74,7 @@ class WorkoutParser:
     def _parse_step_type(step_type_data: Dict[str, Any]) -> StepType:
         """Map JSON step type to StepType enum"""
         key = step_type_data.get("stepTypeKey")
-
-        step_type_map = {
-            "warmup": StepType.WARMUP,
-            "cooldown": StepType.COOLDOWN,
-            "interval": StepType.INTERVAL,
-            "recovery": StepType.RECOVERY,
-            "rest": StepType.REST,
-            # "other": StepType.OTHER,
-        }
-
-        return step_type_map[key or "other"]
+        return _STEP_TYPE_MAP[key or "other"]
 
     @staticmethod
     def _parse_end_condition(step_data: Dict[str, Any]) -> EndCondition:
@@ -46,14 +84,7 @@ class WorkoutParser:
         value = step_data.get("endConditionValue", 0.0)
         displayable = end_condition_data.get("displayable", True)
 
-        condition_map = {
-            "lap.button": EndConditionType.LAP_BUTTON,
-            "time": EndConditionType.TIME,
-            "distance": EndConditionType.DISTANCE,
-            "calories": EndConditionType.CALORIES,
-        }
-
-        condition_type = condition_map.get(condition_key, EndConditionType.LAP_BUTTON)
+        condition_type = _CONDITION_MAP.get(condition_key, EndConditionType.LAP_BUTTON)
         return EndCondition(
             condition_type=condition_type, value=value, displayable=displayable
         )
@@ -64,27 +95,8 @@ class WorkoutParser:
         target_data = step_data.get("targetType", {})
         target_key = target_data.get("workoutTargetTypeKey")
 
-        if target_key == "no.target":
-            return NoTarget()
-        elif target_key == "cadence":
-            lower = step_data.get("targetValueOne")
-            upper = step_data.get("targetValueTwo")
-            if lower is not None and upper is not None:
-                return CadenceTarget(lower_bound=lower, upper_bound=upper)
-            return NoTarget()
-        elif target_key == "heart.rate.zone":
-            zone = step_data.get("zoneNumber")
-            if zone is not None:
-                return HeartRateZoneTarget(zone_number=zone)
-            return NoTarget()
-        elif target_key == "pace.zone":
-            upper = step_data.get("targetValueOne")
-            lower = step_data.get("targetValueTwo")
-            if lower is not None and upper is not None:
-                return PaceZoneTarget(lower_bound=lower, upper_bound=upper)
-            return NoTarget()
-
-        return NoTarget()
+        target_parser = _TARGET_PARSERS.get(target_key)
+        return target_parser(step_data) if target_parser else NoTarget()
 
     @staticmethod
     def _parse_workout_step(step_data: Dict[str, Any]) -> WorkoutStep:
@@ -1,5 +1,9 @@
 from fastmcp import FastMCP
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from garmin.client import Garmin
 from garmin.models.workout import WorkoutDetailType
@@ -19,20 +23,24 @@ password = os.getenv("GARMIN_PASSWORD")
 assert email is not None, "Garmin email is required to use this server."
 assert password is not None, "Garmin password is required to use this server."
 
-# Try to read existing token from tokenstore
-tokens = None
-try:
-    with open("tokenstore", "r") as f:
-        tokens = f.read().strip()
-except FileNotFoundError:
-    pass
+_garmin: Optional[Garmin] = None
+_garmin_lock = threading.Lock()
 
-# Login (will use existing token if valid, or get new token if needed)
-tokens = Garmin(email, password, tokens=tokens).login()
 
-# Save token to tokenstore file
-with open("tokenstore", "w") as f:
-    f.write(tokens)
+def get_garmin() -> Garmin:
+    """
+    Return the Garmin client, logging in on first use so the server starts
+    without waiting on the Garmin SSO round trips.
+    """
+    global _garmin
+    with _garmin_lock:
+        if _garmin is None:
+            # Reuses the saved tokens when still valid, otherwise logs in and
+            # saves fresh ones
+            client = Garmin(email, password)
+            client.login(tokenstore="tokenstore")
+            _garmin = client
+        return _garmin
 
 
 @mcp.resource(
@@ -41,8 +49,9 @@ with open("tokenstore", "w") as f:
     mime_type="application/json",
 )
 def activities() -> str:
-    return str(
-        Garmin.get_instance().get_activities(start=0, limit=10, activitytype="running")
+    # Garmin returns plain JSON data, so emit JSON rather than a Python repr
+    return json.dumps(
+        get_garmin().get_activities(start=0, limit=10, activitytype="running")
     )
 
 
@@ -52,7 +61,7 @@ def activities() -> str:
     mime_type="application/json",
 )
 def user_profile() -> str:
-    return str(Garmin.get_instance().get_user_profile())
+    return str(get_garmin().get_user_profile())
 
 
 @mcp.resource(
@@ -80,9 +89,7 @@ def user_fitness_data() -> str:
     Returns:
         str: Comprehensive fitness data in unified format
     """
-    return str(
-        Garmin.get_instance().get_comprehensive_fitness_data(limit_activities=15)
-    )
+    return str(get_garmin().get_comprehensive_fitness_data(limit_activities=15))
 
 
 @mcp.tool
@@ -96,37 +103,46 @@ def create_workouts(workouts: list[WorkoutDetailType]) -> str:
     """
     # Validate all workouts first
     for i, workout in enumerate(workouts):
-        if not hasattr(workout, "scheduled_date") or workout.scheduled_date is None:
+        if workout.scheduled_date is None:
             return f"Error: Workout {i+1} ('{workout.workout_name}') is missing required scheduled_date field"
 
-    garmin_client = Garmin.get_instance()
+    garmin_client = get_garmin()
+
+    def upload(workout: WorkoutDetailType) -> tuple[str, bool]:
+        """Create a workout and schedule it. Returns (result line, scheduled)."""
+        response = garmin_client.create_workout(workout)
+        workout_id = response.json().get("workoutId")
+        if not workout_id:
+            return (
+                f"✓ '{workout.workout_name}' uploaded successfully (no ID returned)",
+                False,
+            )
+
+        garmin_client.schedule_workout(str(workout_id), workout)
+        date_str = (
+            workout.scheduled_date.strftime("%Y-%m-%d")
+            if workout.scheduled_date
+            else "unscheduled"
+        )
+        return (
+            f"✓ '{workout.workout_name}' uploaded and scheduled for {date_str} (ID: {workout_id})",
+            True,
+        )
+
+    # Uploads are independent round trips, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(upload, workout) for workout in workouts]
+
     results = []
     successful = 0
     failed = 0
     scheduled = 0
-
-    for i, workout in enumerate(workouts):
+    for workout, future in zip(workouts, futures):
         try:
-            response = garmin_client.create_workout(workout)
-            workout_id = response.json().get("workoutId")
+            result, was_scheduled = future.result()
+            results.append(result)
             successful += 1
-
-            if workout_id:
-                garmin_client.schedule_workout(str(workout_id), workout)
-                date_str = (
-                    workout.scheduled_date.strftime("%Y-%m-%d")
-                    if workout.scheduled_date
-                    else "unscheduled"
-                )
-                results.append(
-                    f"✓ '{workout.workout_name}' uploaded and scheduled for {date_str} (ID: {workout_id})"
-                )
-                scheduled += 1
-            else:
-                results.append(
-                    f"✓ '{workout.workout_name}' uploaded successfully (no ID returned)"
-                )
-
+            scheduled += was_scheduled
         except Exception as e:
             results.append(f"✗ '{workout.workout_name}' failed: {str(e)}")
             failed += 1
@@ -152,14 +168,19 @@ def update_workouts(workouts: list[tuple[int, WorkoutDetailType]]) -> str:
     Returns:
         Summary of update results
     """
-    garmin_client = Garmin.get_instance()
+    garmin_client = get_garmin()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(garmin_client.update_workout, str(workout_id), workout)
+            for workout_id, workout in workouts
+        ]
+
     results = []
     successful = 0
     failed = 0
-
-    for workout_id, workout in workouts:
+    for (workout_id, workout), future in zip(workouts, futures):
         try:
-            garmin_client.update_workout(str(workout_id), workout)
+            future.result()
             successful += 1
             results.append(
                 f"✓ Workout {workout_id} ('{workout.workout_name}') updated successfully"
@@ -190,7 +211,7 @@ def delete_recent_workouts(max_age_hours: float = 1.0) -> str:
         return datetime.fromisoformat(date_str)
 
     try:
-        garmin_client = Garmin.get_instance()
+        garmin_client = get_garmin()
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
         workouts = garmin_client.get_workouts_by_source()
@@ -201,10 +222,16 @@ def delete_recent_workouts(max_age_hours: float = 1.0) -> str:
         if not recent_workouts:
             return f"No workouts found that are less than {max_age_hours} hours old"
 
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(garmin_client.delete_workout, str(w.workout_id))
+                for w in recent_workouts
+            ]
+
         results = []
-        for workout in recent_workouts:
+        for workout, future in zip(recent_workouts, futures):
             try:
-                garmin_client.delete_workout(str(workout.workout_id))
+                future.result()
                 results.append(f"✓ '{workout.workout_name}' deleted")
             except Exception as e:
                 results.append(f"✗ '{workout.workout_name}' failed: {e}")